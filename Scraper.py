@@ -20,9 +20,22 @@ import re
 import time
 import json
 import random
+import pickle
+import cProfile
+import pstats
+import signal
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from itertools import groupby
 from datetime import datetime, timedelta, timezone
 import argparse
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 # ------------ Selenium Imports ------------
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -35,16 +48,45 @@ from selenium.common.exceptions import TimeoutException, WebDriverException
 import gspread
 from google.oauth2.service_account import Credentials
 from gspread.exceptions import WorksheetNotFound, APIError
+from gspread.utils import absolute_range_name, fill_gaps
+
+# ------------ HTML Parsing Imports ------------
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
 
 # ============================================================================
 # CONFIGURATION SECTION - Detailed Settings with Comments
 # ============================================================================
 
 # --- URLs Configuration ---
+BASE_URL = "https://damadam.pk"
 LOGIN_URL = "https://damadam.pk/login/"
 HOME_URL = "https://damadam.pk/"
 ONLINE_URL = "https://damadam.pk/online_kon/"
+# LOGGED_IN_SELECTOR: Element only shown to a logged-in user (the home page may also be served to visitors)
+LOGGED_IN_SELECTOR = "a[href*='logout']"
 COOKIE_FILE = "damadam_cookies.pkl"
+# PROFILES_CACHE_FILE: Local copy of the ProfilesData rows so restarts only download new rows
+PROFILES_CACHE_FILE = "profiles_cache.pkl"
+# PROFILES_CACHE_VERSION: Bumped when the cached row format changes (2: link columns hold URLs)
+PROFILES_CACHE_VERSION = 2
+# PROFILE_STATS_FILE: cProfile output written by --profile (open with pstats or snakeviz)
+PROFILE_STATS_FILE = "scraper.prof"
+
+# --- HTTP Configuration ---
+# USER_AGENT: Shared by the headless browser and the cookie-authenticated HTTP session
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+# HTTP_TIMEOUT: Timeout for plain HTTP page fetches (seconds)
+HTTP_TIMEOUT = int(os.getenv('HTTP_TIMEOUT', '10'))
+# HTTP_POOL_SIZE: Keep-alive connections kept open to damadam.pk (reused across all page fetches)
+HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', '8'))
+# SCRAPE_WORKERS: Profiles fetched concurrently (sheet writes stay on the main thread)
+SCRAPE_WORKERS = int(os.getenv('SCRAPE_WORKERS', '4'))
+# REQUEST_INTERVAL: Minimum gap between any two page requests to damadam.pk, across all workers (seconds)
+REQUEST_INTERVAL = float(os.getenv('REQUEST_INTERVAL', '0.5'))
+# REQUEST_INTERVAL_MAX: Ceiling for the gap as it widens after failed scrapes (seconds)
+REQUEST_INTERVAL_MAX = float(os.getenv('REQUEST_INTERVAL_MAX', '3.0'))
 
 # --- Authentication from Environment Variables ---
 USERNAME = os.getenv('DAMADAM_USERNAME', '')
@@ -55,8 +97,10 @@ SHEET_URL = os.getenv('GOOGLE_SHEET_URL', '')
 GOOGLE_CREDENTIALS_RAW = os.getenv('GOOGLE_CREDENTIALS_JSON', '')
 
 # --- Performance & Rate Limiting Configuration ---
-# MAX_PROFILES_PER_RUN: Maximum profiles to scrape in one run (0 = unlimited)
+# MAX_PROFILES_PER_RUN: Maximum profiles to scrape in one run, failures included (0 = unlimited)
 MAX_PROFILES_PER_RUN = int(os.getenv('MAX_PROFILES_PER_RUN', '0'))
+# FRESH_TTL: Online mode skips profiles scraped within this many minutes (0 = scrape every online user)
+FRESH_TTL = int(os.getenv('FRESH_TTL', '0'))
 # BATCH_SIZE: Number of profiles before checking API quota
 BATCH_SIZE = int(os.getenv('BATCH_SIZE', '10'))
 # MIN_DELAY & MAX_DELAY: Adaptive delay range (seconds) between requests
@@ -64,8 +108,25 @@ MIN_DELAY = float(os.getenv('MIN_DELAY', '0.5'))
 MAX_DELAY = float(os.getenv('MAX_DELAY', '0.7'))
 # PAGE_LOAD_TIMEOUT: Maximum time to wait for page load (seconds)
 PAGE_LOAD_TIMEOUT = int(os.getenv('PAGE_LOAD_TIMEOUT', '30'))
+# CHROME_PROFILE_DIR: Persistent Chrome profile (cookies, cache) so a still-valid login is reused; empty = fresh profile
+CHROME_PROFILE_DIR = os.getenv('CHROME_PROFILE_DIR', '')
 # SHEET_WRITE_DELAY: Delay after each Google Sheets API call (seconds)
 SHEET_WRITE_DELAY = float(os.getenv('SHEET_WRITE_DELAY', '1.0'))
+# SHEET_MAX_RETRIES: Retries for a Google Sheets call rejected with 429/5xx before giving up
+SHEET_MAX_RETRIES = int(os.getenv('SHEET_MAX_RETRIES', '5'))
+# SHEET_RETRY_BASE & SHEET_RETRY_CAP: Exponential backoff start and ceiling (seconds)
+SHEET_RETRY_BASE = float(os.getenv('SHEET_RETRY_BASE', '2.0'))
+SHEET_RETRY_CAP = float(os.getenv('SHEET_RETRY_CAP', '60.0'))
+
+# --- Auto-Repeat Configuration ---
+# AUTO_REPEAT: Keep running in-process, reusing the logged-in browser and loaded sheets
+AUTO_REPEAT = os.getenv('AUTO_REPEAT', 'false').lower() == 'true'
+# REPEAT_INTERVAL: Minutes from the start of one run to the start of the next
+REPEAT_INTERVAL = int(os.getenv('REPEAT_INTERVAL', '15'))
+# MAX_REPEATS: Stop after this many runs (0 = unlimited)
+MAX_REPEATS = int(os.getenv('MAX_REPEATS', '0'))
+# KEEPALIVE_INTERVAL: While waiting between runs, check the browser and login this often (seconds)
+KEEPALIVE_INTERVAL = int(os.getenv('KEEPALIVE_INTERVAL', '300'))
 
 # --- Auto-Optimization Settings ---
 # After scraping 10 profiles, system auto-optimizes batch size and delays
@@ -82,6 +143,8 @@ COLUMN_ORDER = [
     "POSTS", "PROFILE LINK", "INTRO", "SOURCE", "DATETIME SCRAP"
 ]
 COLUMN_TO_INDEX = {name: idx for idx, name in enumerate(COLUMN_ORDER)}
+# Empty profile row in column order; scrape_profile fills in what it finds
+PROFILE_TEMPLATE = {**dict.fromkeys(COLUMN_ORDER, ""), "SOURCE": "Online"}
 
 # --- Highlighting Configuration ---
 # ENABLE_CELL_HIGHLIGHT: Set to False to disable cell highlighting (using Notes instead)
@@ -92,6 +155,28 @@ HIGHLIGHT_EXCLUDE_COLUMNS = {"LAST POST", "LAST POST TIME", "JOINED", "PROFILE L
 # --- Link Columns Configuration ---
 # Columns that contain URLs and need special processing
 LINK_COLUMNS = {"IMAGE", "LAST POST", "PROFILE LINK"}
+# HYPERLINK formula per link column, labelled with the column name; filled with the URL
+LINK_FORMULAS = {name: f'=HYPERLINK("{{}}", "{name}")' for name in LINK_COLUMNS}
+# URL inside a HYPERLINK formula read back from the sheet
+HYPERLINK_URL_RE = re.compile(r'^=HYPERLINK\("([^"]*)"', re.IGNORECASE)
+
+# --- Profile Field Labels ---
+# Bold labels on the profile page mapped to their ProfilesData column
+PROFILE_FIELD_LABELS = {'City:': 'CITY', 'Gender:': 'GENDER', 'Married:': 'MARRIED', 'Age:': 'AGE', 'Joined:': 'JOINED'}
+
+# --- Profile Image Selector ---
+# Avatar images, or cloudfront images inside the whitesmoke profile card (one query)
+PROFILE_IMAGE_XPATH = (
+    "//img[contains(@src, 'avatar')"
+    " or (contains(@src, 'cloudfront.net') and ancestor::div[contains(@style, 'whitesmoke')])]/@src"
+)
+
+# --- Profile Header Selector ---
+# Nearest div/section around the profile heading that also holds the labelled profile fields
+PROFILE_HEADER_XPATH = (
+    "//h1[contains(@class, 'cxl')]/ancestor::*[self::div or self::section]"
+    "[.//b[" + " or ".join(f"contains(., '{label}')" for label in PROFILE_FIELD_LABELS) + "]][1]"
+)
 
 # --- Suspension Detection Indicators ---
 # Keywords that indicate account suspension
@@ -102,6 +187,34 @@ SUSPENSION_INDICATORS = [
     "kisi aur user ki identity apnana",
     "accounts suspend kiye",
 ]
+# All indicators compiled into one case-insensitive alternation (single pass per page)
+SUSPENSION_RE = re.compile("|".join(re.escape(s) for s in SUSPENSION_INDICATORS), re.IGNORECASE)
+
+# --- Text Normalization ---
+# Single-pass translation table: nbsp/tabs become spaces, zero-width spaces and CRs are dropped
+CLEAN_TEXT_TABLE = str.maketrans({'\xa0': ' ', '\u200b': '', '\r': '', '\t': ' '})
+# NEEDS_CLEAN_RE: Matches only if translate/whitespace collapsing would change the string (any
+# whitespace other than a single inner space, or a zero-width space)
+NEEDS_CLEAN_RE = re.compile(r"[^\S ]|\u200b|  |^ | $")
+
+# PLACEHOLDER_VALUES: Profile placeholders that clean_data turns into empty cells
+PLACEHOLDER_VALUES = frozenset({
+    "No city", "Not set", "[No Posts]", "N/A", "no city", "not set", "[no posts]", "n/a",
+    "[No Post URL]", "[Error]", "no set", "none", "null", "no age",
+})
+# Abbreviated units ("5 mins ago", "2hrs ago") expanded in one pass; whole tokens only
+UNIT_ABBREVIATIONS = {"mins": "minutes", "min": "minute", "secs": "seconds", "sec": "second", "hrs": "hours", "hr": "hour"}
+UNIT_ABBR_RE = re.compile(r"(?<![a-z])(mins|min|secs|sec|hrs|hr)(?![a-z])")
+# Relative dates such as "3 hours ago" and the seconds in each unit
+RELATIVE_DATE_RE = re.compile(r"(\d+)\s*(second|minute|hour|day|week|month|year)s?\s*ago")
+UNIT_SECONDS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400, "week": 604800, "month": 2592000, "year": 31536000}
+# ALPHA_RE: Any Unicode letter (same test as str.isalpha, run in C); nicknames must contain one
+ALPHA_RE = re.compile(r"[^\W\d_]")
+# NICK_RE: At least 3 characters, one of them a letter (one C-level match per nickname)
+NICK_RE = re.compile(r"(?=.*[^\W\d_]).{3}", re.S)
+DIGITS_RE = re.compile(r"\d+")
+COMMENT_TEXT_RE = re.compile(r"/comments/text/(\d+)/")
+COMMENT_IMAGE_RE = re.compile(r"/comments/image/(\d+)/")
 
 # --- Sheet Names Configuration ---
 PROFILES_SHEET_NAME = "ProfilesData"  # Main data sheet
@@ -127,74 +240,142 @@ TIMING_LOG_HEADERS = ["Nickname", "Timestamp", "Source", "Run Number"]
 # Marital Status Emojis
 EMOJI_MARRIED_YES = "💞"
 EMOJI_MARRIED_NO = "🖤"
+MARRIED_EMOJI = {
+    'yes': EMOJI_MARRIED_YES, 'married': EMOJI_MARRIED_YES,
+    'no': EMOJI_MARRIED_NO, 'single': EMOJI_MARRIED_NO, 'unmarried': EMOJI_MARRIED_NO,
+}
+
+# Gender Emojis
+GENDER_EMOJI = {'female': "💃", 'male': "👨"}
 
 # Verification Status Emojis
 EMOJI_VERIFIED = "🎫"
 EMOJI_UNVERIFIED = "🚫"
 
+# --- Timezone ---
+PKT_OFFSET_SECONDS = 5 * 3600  # Pakistan Standard Time (no DST)
+PKT = timezone(timedelta(seconds=PKT_OFFSET_SECONDS))
+# Resources the headless browser never needs to download
+BLOCKED_URL_PATTERNS = ["*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg", "*.ico",
+                        "*.css", "*.woff", "*.woff2", "*.ttf", "*.mp4", "*.webm", "*.mp3"]
+
+# Minute-resolution timestamp used in every sheet (e.g. 05-Mar-25 02:15 PM)
+DATETIME_FORMAT = "%d-%b-%y %I:%M %p"
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
 def get_pkt_time():
     """Get current time in Pakistan timezone (UTC+5)"""
-    return datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=5)
+    return datetime.now(PKT)
+
+@lru_cache(maxsize=4)
+def _format_pkt_minute(minute: int) -> str:
+    return datetime.fromtimestamp(minute * 60, PKT).strftime(DATETIME_FORMAT)
+
+def pkt_timestamp() -> str:
+    """Current PKT time as DATETIME_FORMAT; formatted once per minute"""
+    return _format_pkt_minute(int(time.time() // 60))
+
+_log_stamp = (0, "")
 
 def log_msg(msg):
-    """Print timestamped log message"""
-    print(f"[{get_pkt_time().strftime('%H:%M:%S')}] {msg}")
+    """Print timestamped log message (one write per line, so lines from worker threads don't interleave)"""
+    global _log_stamp
+    # Many lines share a second, so the HH:MM:SS text is formatted once per second
+    second = int(time.time()) + PKT_OFFSET_SECONDS
+    cached_second, stamp = _log_stamp
+    if second != cached_second:
+        stamp = time.strftime('%H:%M:%S', time.gmtime(second))
+        _log_stamp = (second, stamp)
+    sys.stdout.write(f"[{stamp}] {msg}\n")
     sys.stdout.flush()
 
-def column_letter(col_idx: int) -> str:
-    """Convert column index to letter (0='A', 1='B', etc.)"""
-    res = ""
+def _column_letter(col_idx: int) -> str:
+    letters = []
     col_idx += 1
     while col_idx > 0:
-        col_idx -= 1
-        res = chr(col_idx % 26 + ord('A')) + res
-        col_idx //= 26
-    return res
+        col_idx, rem = divmod(col_idx - 1, 26)
+        letters.append(chr(rem + ord('A')))
+    return "".join(reversed(letters))
+
+# Letters for columns A..ZZ
+COLUMN_LETTERS = tuple(_column_letter(i) for i in range(702))
+
+def column_letter(col_idx: int) -> str:
+    """Convert column index to letter (0='A', 1='B', etc.)"""
+    return COLUMN_LETTERS[col_idx] if 0 <= col_idx < 702 else _column_letter(col_idx)
 
+@lru_cache(maxsize=1024)
 def clean_data(v: str) -> str:
     """Clean and normalize data values"""
     if not v:
         return ""
-    v = str(v).strip().replace('\xa0', ' ')
-    bad = {"No city","Not set","[No Posts]","N/A","no city","not set","[no posts]","n/a","[No Post URL]","[Error]","no set","none","null","no age"}
-    return "" if v in bad else re.sub(r"\s+"," ", v)
+    v = str(v)
+    if v in PLACEHOLDER_VALUES:
+        return ""
+    if not NEEDS_CLEAN_RE.search(v):
+        return v
+    v = v.translate(CLEAN_TEXT_TABLE).strip()
+    return "" if v in PLACEHOLDER_VALUES else " ".join(v.split())
+
+@lru_cache(maxsize=512)
+def relative_date_offset(text: str) -> int | None:
+    """Parse a relative date (e.g., '2 days ago') into seconds ago; None if not relative"""
+    t = text.lower().strip()
+    t = UNIT_ABBR_RE.sub(lambda m: UNIT_ABBREVIATIONS[m.group(1)], t)
+    m = RELATIVE_DATE_RE.search(t)
+    if not m:
+        return None
+    return int(m.group(1)) * UNIT_SECONDS[m.group(2)]
 
 def convert_relative_date_to_absolute(text: str) -> str:
     """Convert relative dates (e.g., '2 days ago') to absolute format"""
     if not text:
         return ""
-    t = text.lower().strip()
-    t = t.replace("mins","minutes").replace("min","minute").replace("secs","seconds").replace("sec","second").replace("hrs","hours").replace("hr","hour")
-    m = re.search(r"(\d+)\s*(second|minute|hour|day|week|month|year)s?\s*ago", t)
-    if not m:
+    offset = relative_date_offset(text)
+    if offset is None:
         return text
-    amt = int(m.group(1)); unit = m.group(2)
-    delta_map = {"second":1,"minute":60,"hour":3600,"day":86400,"week":604800,"month":2592000,"year":31536000}
-    if unit in delta_map:
-        dt = get_pkt_time() - timedelta(seconds=amt*delta_map[unit])
-        return dt.strftime("%d-%b-%y")
-    return text
+    dt = get_pkt_time() - timedelta(seconds=offset)
+    return dt.strftime("%d-%b-%y")
+
+def normalize_gender(value: str) -> str:
+    """Map gender text to its emoji"""
+    low = value.lower()
+    emoji = GENDER_EMOJI.get(low)
+    if emoji is None:
+        # Longer labels that merely contain the word
+        emoji = GENDER_EMOJI['female'] if 'female' in low else GENDER_EMOJI['male'] if 'male' in low else ""
+    return emoji
+
+def normalize_married(value: str) -> str:
+    """Map marital status text to its emoji (unknown values pass through)"""
+    return MARRIED_EMOJI.get(value.lower(), value)
+
+# Per-column normalizers for labelled profile fields (others use clean_data)
+PROFILE_FIELD_HANDLERS = {
+    'JOINED': convert_relative_date_to_absolute,
+    'GENDER': normalize_gender,
+    'MARRIED': normalize_married,
+}
 
 def detect_suspension_reason(page: str) -> str | None:
     """Detect if account is suspended and return reason"""
     if not page:
         return None
-    lower = page.lower()
-    for indicator in SUSPENSION_INDICATORS:
-        if indicator in lower:
-            return indicator
-    return None
+    m = SUSPENSION_RE.search(page)
+    return m.group(0).lower() if m else None
 
+@lru_cache(maxsize=1024)
 def clean_text(text: str) -> str:
     """Clean and normalize text content"""
     if not text:
         return ""
-    text = str(text).strip().replace('\xa0',' ').replace('\n',' ')
-    return re.sub(r"\s+"," ", text).strip()
+    text = str(text)
+    if not NEEDS_CLEAN_RE.search(text):
+        return text
+    return " ".join(text.translate(CLEAN_TEXT_TABLE).split())
 
 def parse_post_timestamp(text: str) -> str:
     """Parse post timestamp"""
@@ -205,23 +386,21 @@ def to_absolute_url(href: str) -> str:
     if not href:
         return ""
     href = href.strip()
-    if href.startswith('/'):
-        return f"https://damadam.pk{href}"
-    if not href.startswith('http'):
-        return f"https://damadam.pk/{href}"
-    return href
-
-def get_friend_status(driver) -> str:
-    """Check if user is a friend"""
-    try:
-        page_source = driver.page_source.lower()
-        if 'action="/follow/remove/"' in page_source or 'unfollow.svg' in page_source:
-            return "Yes"
-        if 'follow.svg' in page_source and 'unfollow' not in page_source:
-            return "No"
-        return ""
-    except Exception:
-        return ""
+    if href.startswith(('http:', 'https:')):
+        return href
+    if href.startswith('//'):
+        return 'https:' + href
+    if href[:1] == '/':
+        return BASE_URL + href
+    return f"{BASE_URL}/{href}"
+
+def get_friend_status(tree) -> str:
+    """Check if user is a friend (follow form / follow icon on the parsed page)"""
+    if xpath("boolean(//form[@action='/follow/remove/'] | //img[contains(@src, 'unfollow.svg')])")(tree):
+        return "Yes"
+    if xpath("boolean(//img[contains(@src, 'follow.svg')])")(tree) and not xpath("boolean(//@*[contains(., 'unfollow')])")(tree):
+        return "No"
+    return ""
 
 def calculate_eta(processed: int, total: int, start_ts: float) -> str:
     """Calculate estimated time to completion"""
@@ -240,29 +419,70 @@ def calculate_eta(processed: int, total: int, start_ts: float) -> str:
 
 def extract_text_comment_url(href: str) -> str:
     """Extract text comment URL"""
-    m = re.search(r'/comments/text/(\d+)/', href or '')
+    m = COMMENT_TEXT_RE.search(href or '')
     if m:
         return to_absolute_url(f"/comments/text/{m.group(1)}/").rstrip('/')
     return to_absolute_url(href or '')
 
 def extract_image_comment_url(href: str) -> str:
     """Extract image comment URL"""
-    m = re.search(r'/comments/image/(\d+)/', href or '')
+    m = COMMENT_IMAGE_RE.search(href or '')
     if m:
         return to_absolute_url(f"/content/{m.group(1)}/g/")
     return to_absolute_url(href or '')
 
-def scrape_recent_post(driver, nickname: str) -> dict:
+# Compiled selectors, cached per thread (lxml evaluators are not shared between scrape workers)
+_selector_cache = threading.local()
+
+def css(selector: str) -> CSSSelector:
+    """Compiled CSS selector; call it with an element to get the matches"""
+    cache = _selector_cache.__dict__.setdefault("css", {})
+    compiled = cache.get(selector)
+    if compiled is None:
+        compiled = cache[selector] = CSSSelector(selector, translator="html")
+    return compiled
+
+def xpath(expr: str) -> etree.XPath:
+    """Compiled XPath expression; call it with an element to evaluate"""
+    cache = _selector_cache.__dict__.setdefault("xpath", {})
+    compiled = cache.get(expr)
+    if compiled is None:
+        compiled = cache[expr] = etree.XPath(expr)
+    return compiled
+
+def profile_header(tree):
+    """Return the block enclosing the profile heading and fields, or the whole page if there is none
+    (e.g. a suspended profile without fields, or a wrapper holding only the heading)"""
+    header = xpath(PROFILE_HEADER_XPATH)(tree)
+    return header[0] if header else tree
+
+def extract_profile_fields(tree) -> dict:
+    """Extract labelled profile fields, stopping the walk once all labels are found"""
+    found = {}
+    remaining = set(PROFILE_FIELD_LABELS)
+    for _, b in etree.iterwalk(tree, events=("start",), tag="b"):
+        text = b.text or ''
+        label = next((l for l in remaining if l in text), None)
+        if not label:
+            continue
+        remaining.discard(label)
+        spans = xpath("following-sibling::span[1]")(b)
+        if spans:
+            found[PROFILE_FIELD_LABELS[label]] = spans[0].text_content().strip()
+        if not remaining:
+            break
+    return found
+
+def scrape_recent_post(driver, session, nickname: str) -> dict:
     """Scrape the most recent post from user's profile"""
-    post_url = f"https://damadam.pk/profile/public/{nickname}"
+    post_url = f"{BASE_URL}/profile/public/{nickname}"
     try:
-        driver.get(post_url)
         try:
-            WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.CSS_SELECTOR, "article.mbl")))
+            _, tree = fetch_page(driver, session, post_url, "article.mbl", timeout=5)
         except TimeoutException:
             return {'LPOST': '', 'LDATE-TIME': ''}
 
-        recent_post = driver.find_element(By.CSS_SELECTOR, "article.mbl")
+        recent_post = css("article.mbl")(tree)[0]
         post_data = {'LPOST': '', 'LDATE-TIME': ''}
 
         url_selectors = [
@@ -271,26 +491,21 @@ def scrape_recent_post(driver, nickname: str) -> dict:
             ("a[href*='/comments/image/']", extract_image_comment_url),
         ]
         for selector, formatter in url_selectors:
-            try:
-                link = recent_post.find_element(By.CSS_SELECTOR, selector)
-                href = link.get_attribute('href')
-                if href:
-                    formatted = formatter(href)
-                    if formatted:
-                        post_data['LPOST'] = formatted
-                        break
-            except Exception:
-                continue
+            links = css(selector)(recent_post)
+            href = links[0].get('href') if links else None
+            if href:
+                formatted = formatter(href)
+                if formatted:
+                    post_data['LPOST'] = formatted
+                    break
 
         time_selectors = ["span[itemprop='datePublished']", "time[itemprop='datePublished']", "span.cxs.cgy", "time"]
         for sel in time_selectors:
-            try:
-                time_elem = recent_post.find_element(By.CSS_SELECTOR, sel)
-                if time_elem.text.strip():
-                    post_data['LDATE-TIME'] = parse_post_timestamp(time_elem.text.strip())
-                    break
-            except Exception:
-                continue
+            elems = css(sel)(recent_post)
+            text = elems[0].text_content().strip() if elems else ""
+            if text:
+                post_data['LDATE-TIME'] = parse_post_timestamp(text)
+                break
         return post_data
     except Exception:
         return {'LPOST': '', 'LDATE-TIME': ''}
@@ -314,6 +529,7 @@ class AdaptiveDelay:
         self.hits = 0
         self.last = time.time()
         self.batch_size = BATCH_SIZE
+        self.forced_until = 0.0
         
     def on_success(self):
         """Called on successful API call - gradually reduce delays"""
@@ -324,9 +540,11 @@ class AdaptiveDelay:
             self.max_delay = max(self.base_max, self.max_delay * 0.95)
             self.last = time.time()
     
-    def on_rate_limit(self):
-        """Called on rate limit error - increase delays"""
+    def on_rate_limit(self, retry_after: float | None = None):
+        """Called on rate limit error - increase delays (retry_after: server-requested wait, seconds)"""
         self.hits += 1
+        if retry_after:
+            self.forced_until = max(self.forced_until, time.time() + retry_after)
         factor = 1 + min(0.2 * self.hits, 1.0)
         self.min_delay = min(3.0, self.min_delay * factor)
         self.max_delay = min(6.0, self.max_delay * factor)
@@ -345,10 +563,49 @@ class AdaptiveDelay:
             self.max_delay = max(self.base_max, self.max_delay * DELAY_REDUCTION_FACTOR)
     
     def sleep(self):
-        """Apply random delay in current range"""
-        delay = random.uniform(self.min_delay, self.max_delay)
+        """Wait out any server-requested pause, then a full-jitter delay that widens with recent rate limits"""
+        forced = self.forced_until - time.time()
+        if forced > 0:
+            time.sleep(forced)
+        delay = random.uniform(0, min(self.max_delay, self.min_delay * 2 ** self.hits))
         time.sleep(delay)
 
+# Shared instance, created in main(); rate-limit retries escalate its delays too
+adaptive = None
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503}
+
+def api_status(err: APIError) -> int | None:
+    """HTTP status code of a failed Sheets call, if there was a response"""
+    return getattr(getattr(err, "response", None), "status_code", None)
+
+def retry_after_seconds(err: APIError) -> float | None:
+    """Retry-After header of a failed Sheets call in seconds, if the server sent one"""
+    response = getattr(err, "response", None)
+    try:
+        return float(response.headers.get("Retry-After"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+def retry_on_rate_limit(func):
+    """Retry a Google Sheets call on 429/5xx with jittered exponential backoff (honours Retry-After)"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        for attempt in range(SHEET_MAX_RETRIES + 1):
+            try:
+                return func(*args, **kwargs)
+            except APIError as e:
+                status = api_status(e)
+                if status not in RETRYABLE_STATUS_CODES or attempt == SHEET_MAX_RETRIES:
+                    raise
+                retry_after = retry_after_seconds(e)
+                delay = retry_after or min(SHEET_RETRY_CAP, SHEET_RETRY_BASE * 2 ** attempt) * random.uniform(0.5, 1.5)
+                if adaptive:
+                    adaptive.on_rate_limit(retry_after)
+                log_msg(f"⏳ Sheets API {status} in {func.__name__}, retry {attempt + 1}/{SHEET_MAX_RETRIES} in {delay:.1f}s")
+                time.sleep(delay)
+    return wrapper
+
 # ============================================================================
 # GOOGLE SHEETS CLIENT SETUP
 # ============================================================================
@@ -359,6 +616,11 @@ def gsheets_client():
         creds_dict = json.loads(GOOGLE_CREDENTIALS_RAW)
         creds = Credentials.from_service_account_info(creds_dict, scopes=["https://www.googleapis.com/auth/spreadsheets"])
         client = gspread.authorize(creds)
+        # Sheets calls come in bursts minutes apart: reconnect when an idle keep-alive connection was dropped.
+        # urllib3 counts a dropped connection (RemoteDisconnected) as a read error, and retries those only for
+        # idempotent methods, so reads are resent while POST writes (which may have landed) are not.
+        # 429/5xx responses are handled by retry_on_rate_limit.
+        client.session.mount("https://", HTTPAdapter(max_retries=Retry(total=3, connect=3, read=3, status=0, other=0, backoff_factor=0.5)))
         return client
     except Exception as e:
         log_msg(f"❌ Google credentials error: {e}")
@@ -377,34 +639,87 @@ def setup_browser():
     options.add_argument("--disable-gpu")
     options.add_argument("--disable-software-rasterizer")
     options.add_argument("--window-size=1920,1080")
-    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    options.add_argument(f"user-agent={USER_AGENT}")
+    # No extensions, notifications, background services or translate/bfcache work in a scraping session
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-default-apps")
+    options.add_argument("--disable-notifications")
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--disable-background-timer-throttling")
+    options.add_argument("--disable-renderer-backgrounding")
+    options.add_argument("--disable-features=Translate,BackForwardCache,OptimizationHints")
+    # Only DOM text and attributes are read, so skip downloading images (CSS and fonts are blocked by URL below)
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+    if CHROME_PROFILE_DIR:
+        options.add_argument(f"--user-data-dir={os.path.abspath(CHROME_PROFILE_DIR)}")
+        options.add_argument("--profile-directory=Default")
+        options.add_argument("--disk-cache-size=104857600")
+    # Return from driver.get at DOMContentLoaded; callers wait for the elements they need
+    options.page_load_strategy = "eager"
     try:
         driver = webdriver.Chrome(options=options)
         driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        # Stop stylesheets, fonts and media at the network layer; Chrome has no content settings for them
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except WebDriverException:
+            pass
         return driver
     except Exception as e:
         log_msg(f"❌ Browser setup failed: {e}")
         return None
 
+def submit_login(driver, username: str, password: str) -> bool:
+    """Fill and submit the login form; True once the browser has left the login page"""
+    driver.get(LOGIN_URL)
+    WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.NAME, "email")))
+    driver.find_element(By.NAME, "email").send_keys(username)
+    driver.find_element(By.NAME, "pass").send_keys(password)
+    driver.find_element(By.CSS_SELECTOR, "button[type=submit]").click()
+    try:
+        # Redirect away from /login/ on success; a form error list means it was rejected
+        WebDriverWait(driver, 10).until(
+            lambda d: "/login/" not in d.current_url or d.find_elements(By.CSS_SELECTOR, "ul.errorlist, .error")
+        )
+    except TimeoutException:
+        pass
+    return "/login/" not in driver.current_url
+
+def session_logged_in(session) -> bool | None:
+    """True if the HTTP session is authenticated (the home page shows the logged-in-only logout link),
+    False if it is not, None if the home page could not be fetched to tell"""
+    wait_for_request_slot()
+    try:
+        resp = session.get(HOME_URL, timeout=HTTP_TIMEOUT)
+    except requests.RequestException as e:
+        log_msg(f"🌐 HTTP error for {HOME_URL}: {str(e)[:50]}")
+        return None
+    if "/login/" in resp.url or resp.status_code in (401, 403):
+        return False
+    if resp.status_code != 200:
+        return None
+    return bool(css(LOGGED_IN_SELECTOR)(lxml.html.fromstring(resp.content)))
+
+def already_logged_in(driver) -> bool:
+    """True if the browser's saved cookies still give an authenticated session"""
+    # Open the site first so get_cookies returns its cookies
+    driver.get(HOME_URL)
+    return session_logged_in(build_http_session(driver)) is True
+
 def login(driver):
     """Login to damadam.pk"""
     log_msg("🔑 Logging in...")
     try:
-        driver.get(LOGIN_URL)
-        time.sleep(2)
-        driver.find_element(By.NAME, "email").send_keys(USERNAME)
-        driver.find_element(By.NAME, "pass").send_keys(PASSWORD)
-        driver.find_element(By.CSS_SELECTOR, "button[type=submit]").click()
-        time.sleep(3)
-        if "/login/" in driver.current_url:
+        if CHROME_PROFILE_DIR and already_logged_in(driver):
+            log_msg("✅ Reusing login from Chrome profile")
+            return True
+        if not submit_login(driver, USERNAME, PASSWORD):
             log_msg("⚠️ Primary login failed, trying secondary...")
-            driver.get(LOGIN_URL)
-            time.sleep(2)
-            driver.find_element(By.NAME, "email").send_keys(USERNAME_2)
-            driver.find_element(By.NAME, "pass").send_keys(PASSWORD_2)
-            driver.find_element(By.CSS_SELECTOR, "button[type=submit]").click()
-            time.sleep(3)
-            if "/login/" in driver.current_url:
+            if not submit_login(driver, USERNAME_2, PASSWORD_2):
                 log_msg("❌ Login failed")
                 return False
         log_msg("✅ Login successful")
@@ -413,68 +728,265 @@ def login(driver):
         log_msg(f"❌ Login error: {e}")
         return False
 
+# ============================================================================
+# HTTP SESSION - Plain HTTP fetches reusing the browser's login cookies
+# ============================================================================
+
+# Returns outerHTML of the main content container enclosing the target element, or null
+CONTENT_ROOT_JS = """
+const el = document.querySelector(arguments[0]);
+const root = el && el.closest('main, #content, .profile-main');
+return root ? root.outerHTML : null;
+"""
+
+_request_lock = threading.Lock()
+_last_request = 0.0
+# Current gap between requests; grows after failed scrapes and decays back to REQUEST_INTERVAL
+_request_interval = REQUEST_INTERVAL
+# The single browser is only a fallback and is not thread-safe
+_driver_lock = threading.Lock()
+
+def wait_for_request_slot():
+    """Block until the request interval (plus a little jitter) has passed since the previous page request (any thread)"""
+    global _last_request
+    with _request_lock:
+        wait = _last_request + _request_interval + random.uniform(0, 0.2) - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _last_request = time.monotonic()
+
+def note_scrape_result(ok: bool):
+    """Decay the request interval after a successful scrape, widen it geometrically after a failure"""
+    global _request_interval
+    with _request_lock:
+        if ok:
+            _request_interval = max(REQUEST_INTERVAL, _request_interval * 0.9)
+        else:
+            _request_interval = min(REQUEST_INTERVAL_MAX, _request_interval * 1.6)
+
+def build_http_session(driver) -> requests.Session:
+    """Create an HTTP session carrying the logged-in browser's cookies"""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE))
+    session.headers["User-Agent"] = USER_AGENT
+    for c in driver.get_cookies():
+        session.cookies.set(c['name'], c['value'], domain=c.get('domain'), path=c.get('path', '/'))
+    return session
+
+def fetch_html(session, url: str) -> str | None:
+    """Fetch a page over HTTP; returns None if the request fails or is not authenticated"""
+    wait_for_request_slot()
+    try:
+        resp = session.get(url, timeout=HTTP_TIMEOUT)
+    except requests.RequestException as e:
+        log_msg(f"🌐 HTTP error for {url}: {str(e)[:50]}")
+        return None
+    if resp.status_code != 200 or "/login/" in resp.url:
+        return None
+    # Decode with the header charset (the site serves UTF-8); resp.text would run charset detection when it is missing
+    return resp.content.decode(resp.encoding or "utf-8", errors="replace")
+
+def fetch_page(driver, session, url: str, wait_css: str, timeout: int = 10):
+    """Return (html, tree) for a page once wait_css is present.
+    Uses the HTTP session when it is authenticated, otherwise the browser.
+    Raises TimeoutException if the element never appears."""
+    html = fetch_html(session, url) if session else None
+    if html is None:
+        with _driver_lock:
+            wait_for_request_slot()
+            driver.get(url)
+            WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.CSS_SELECTOR, wait_css)))
+            # Pull only the content column around the target element; full page_source as fallback
+            html = driver.execute_script(CONTENT_ROOT_JS, wait_css) or driver.page_source
+    tree = lxml.html.fromstring(html)
+    if not css(wait_css)(tree):
+        raise TimeoutException(f"{wait_css} not found on {url}")
+    return html, tree
+
 # ============================================================================
 # SHEET CLASSES
 # ============================================================================
 
+def open_worksheet(wb, title: str, rows: int, cols: int, worksheets: dict):
+    """Worksheet from the preloaded metadata (no API call); looked up or created if it is not there"""
+    ws = worksheets.get(title)
+    if ws:
+        return ws
+    try:
+        return wb.worksheet(title)
+    except WorksheetNotFound:
+        return wb.add_worksheet(title, rows, cols)
+
+def row_banding_requests(ws, num_cols: int, banded: set) -> list:
+    """addBanding request for the data rows (header excluded), or none if the sheet already has a banded range"""
+    if ws.title in banded:
+        return []
+    return [{
+        "addBanding": {
+            "bandedRange": {
+                "range": {"sheetId": ws.id, "startRowIndex": 1, "startColumnIndex": 0, "endColumnIndex": num_cols},
+                "rowProperties": {
+                    "firstBandColor": {"red": 1.0, "green": 1.0, "blue": 1.0},
+                    "secondBandColor": {"red": 0.95, "green": 0.95, "blue": 0.95},
+                }
+            }
+        }
+    }]
+
 class ProfilesDataSheet:
-    def __init__(self, wb):
-        try:
-            self.ws = wb.worksheet(PROFILES_SHEET_NAME)
-        except WorksheetNotFound:
-            self.ws = wb.add_worksheet(PROFILES_SHEET_NAME, 10000, len(COLUMN_ORDER))
+    def __init__(self, wb, worksheets: dict, banded=frozenset()):
+        self.ws = open_worksheet(wb, PROFILES_SHEET_NAME, 10000, len(COLUMN_ORDER), worksheets)
+        self.banded = banded
         self.existing = {}
+        self._requests = []
         self._load_existing()
-        self.apply_banding()
 
-    def _load_existing(self):
-        data = self.ws.get_all_values()
+    @retry_on_rate_limit
+    def _load_existing(self, use_cache=True):
+        self._cached_rows = 0
+        data = self._load_cached_rows() if use_cache else None
+        if data is None:
+            data = self.ws.get_all_values()
+            self._read_link_urls(data[1:], 2)
+        self._rows = data
+        self.next_row = len(data) + 1
         if data and data[0] == COLUMN_ORDER:
             for row_idx, row in enumerate(data[1:], start=2):
                 nick = row[COLUMN_TO_INDEX["NICK NAME"]]
                 if nick:
                     key = nick.lower()
-                    self.existing[key] = {"row": row_idx, "data": row}
+                    # Rows restored from the local cache may predate manual edits, so they are not trusted for diffing
+                    self.existing[key] = {"row": row_idx, "data": row, "synced": row_idx > self._cached_rows}
+
+    def _load_cached_rows(self):
+        """Rows from the local cache plus any rows appended since, or None if the cache is missing or stale
 
-    def apply_banding(self):
+        The nickname column is re-read to confirm the cached rows still line up with the sheet;
+        edits made to other columns outside the bot are not picked up, so cached rows are rewritten
+        in full the first time the bot writes them.
+        """
         try:
-            # Header formatting
-            self.ws.format("A1:R1", {"backgroundColor": {"red": 0.9, "green": 0.9, "blue": 0.9}, "textFormat": {"bold": True}})
-            # Banding for data rows only
-            banding_request = {
-                "addBanding": {
-                    "bandedRange": {
-                        "range": {"startRowIndex": 1, "endRowIndex": None, "startColumnIndex": 0, "endColumnIndex": len(COLUMN_ORDER)},
-                        "rowProperties": {
-                            "firstBandColor": {"red": 1.0, "green": 1.0, "blue": 1.0},
-                            "secondBandColor": {"red": 0.95, "green": 0.95, "blue": 0.95},
-                        }
-                    }
-                }
-            }
-            self.ws.batch_update([banding_request])
-        except Exception:
-            pass
+            with open(PROFILES_CACHE_FILE, "rb") as f:
+                cache = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        if not isinstance(cache, dict) or cache.get("sheet_id") != self.ws.id or cache.get("version") != PROFILES_CACHE_VERSION:
+            return None
+        rows = cache.get("rows") or []
+        if not rows or rows[0] != COLUMN_ORDER:
+            return None
+
+        nick_idx = COLUMN_TO_INDEX["NICK NAME"]
+        cached_nicks = [row[nick_idx] if len(row) > nick_idx else "" for row in rows]
+        while cached_nicks and not cached_nicks[-1]:
+            cached_nicks.pop()
+        sheet_nicks = self.ws.col_values(nick_idx + 1)
+        if sheet_nicks[:len(cached_nicks)] != cached_nicks:
+            log_msg("⚠️ Profiles cache is stale, reloading full sheet")
+            return None
+
+        width = len(COLUMN_ORDER)
+        # A range starting past the last grid row is rejected (400), and a full sheet has nothing appended anyway
+        new_rows = self.ws.get(f"A{len(rows) + 1}:{column_letter(width - 1)}") if len(rows) < self.ws.row_count else []
+        log_msg(f"💾 Profiles cache: {len(rows) - 1} cached rows, {len(new_rows)} new")
+        self._cached_rows = len(rows)
+        # Unlike get_all_values, get() leaves short rows ragged and blank rows empty
+        new_rows = [list(row) + [""] * (width - len(row)) for row in new_rows]
+        self._read_link_urls(new_rows, len(rows) + 1)
+        return rows + new_rows
+
+    def _read_link_urls(self, rows: list, first_row: int):
+        """Replace the labels shown in link columns with the URLs of their HYPERLINK formulas (in place),
+        so stored rows compare equal to freshly scraped ones; one batchGet for all link columns"""
+        if not rows:
+            return
+        indexes = [COLUMN_TO_INDEX[name] for name in COLUMN_ORDER if name in LINK_COLUMNS]
+        last_row = first_row + len(rows) - 1
+        ranges = [f"{column_letter(i)}{first_row}:{column_letter(i)}{last_row}" for i in indexes]
+        columns = self.ws.batch_get(ranges, major_dimension="COLUMNS", value_render_option="FORMULA")
+        for idx, column in zip(indexes, columns):
+            for row, cell in zip(rows, column[0] if column else []):
+                match = HYPERLINK_URL_RE.match(str(cell))
+                if match:
+                    row[idx] = match.group(1)
 
-    def _update_links(self, row: int, profile: dict):
-        for col_name in LINK_COLUMNS:
-            url = profile.get(col_name, "")
+    def save_cache(self):
+        """Store the current rows locally for the next startup"""
+        try:
+            with open(PROFILES_CACHE_FILE, "wb") as f:
+                pickle.dump({"version": PROFILES_CACHE_VERSION, "sheet_id": self.ws.id, "rows": self._rows}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            log_msg(f"⚠️ Could not save profiles cache: {e}")
+
+    def banding_requests(self) -> list:
+        # Header formatting and banding are set up together, so an existing banding means both are done
+        if self.ws.title in self.banded:
+            return []
+        header_format = {
+            "repeatCell": {
+                "range": self._grid_range(1, 0, len(COLUMN_ORDER)),
+                "cell": {"userEnteredFormat": {"backgroundColor": {"red": 0.9, "green": 0.9, "blue": 0.9},
+                                               "textFormat": {"bold": True}}},
+                "fields": "userEnteredFormat(backgroundColor,textFormat.bold)",
+            }
+        }
+        return [header_format] + row_banding_requests(self.ws, len(COLUMN_ORDER), self.banded)
+
+    def _grid_range(self, row: int, start_col: int, end_col: int) -> dict:
+        """GridRange for columns [start_col, end_col) of a 1-based row"""
+        return {"sheetId": self.ws.id, "startRowIndex": row - 1, "endRowIndex": row,
+                "startColumnIndex": start_col, "endColumnIndex": end_col}
+
+    def _row_data(self, profile: dict, row_values: list) -> dict:
+        """Row as CellData: raw text, with link columns written as HYPERLINK formulas"""
+        cells = []
+        for col_name, value in zip(COLUMN_ORDER, row_values):
+            formula = LINK_FORMULAS.get(col_name)
+            url = profile.get(col_name) if formula else None
             if url:
-                col_idx = COLUMN_TO_INDEX[col_name] + 1
-                formula = f'=HYPERLINK("{url}", "{col_name}")'
-                self.ws.update_cell(row, col_idx, formula)
-
-    def _add_notes(self, row: int, changed: list, before: list, after: list):
+                cells.append({"userEnteredValue": {"formulaValue": formula.format(url)}})
+            else:
+                cells.append({"userEnteredValue": {"stringValue": str(value)}})
+        return {"values": cells}
+
+    def scraped_since(self, nickname: str, cutoff: datetime) -> bool:
+        """True if the stored row's DATETIME SCRAP is at or after cutoff (naive PKT)"""
+        existing = self.existing.get(nickname.lower())
+        if not existing:
+            return False
+        try:
+            scraped = datetime.strptime(existing["data"][COLUMN_TO_INDEX["DATETIME SCRAP"]], DATETIME_FORMAT)
+        except (IndexError, ValueError):
+            return False
+        return scraped >= cutoff
+
+    def _cell_requests(self, row: int, row_data: dict, cols: list) -> list:
+        """updateCells requests writing only the given columns, one request per run of adjacent columns"""
+        cells = row_data["values"]
+        reqs = []
+        for _, run in groupby(enumerate(cols), lambda pair: pair[1] - pair[0]):
+            run = [col for _, col in run]
+            start, end = run[0], run[-1] + 1
+            reqs.append({"updateCells": {"range": self._grid_range(row, start, end),
+                                         "rows": [{"values": cells[start:end]}], "fields": "userEnteredValue"}})
+        return reqs
+
+    def _note_requests(self, row: int, changed: list, before: list, after: list) -> list:
+        reqs = []
         for idx in changed:
-            col = column_letter(idx)
             old = before[idx] if idx < len(before) else ""
             new = after[idx] if idx < len(after) else ""
             note = f"Changed from: {old} to {new}"
-            self.ws.update_note(f"{col}{row}", note)
+            reqs.append({"updateCells": {"range": self._grid_range(row, idx, idx + 1),
+                                         "rows": [{"values": [{"note": note}]}], "fields": "note"}})
+        return reqs
 
     def write_profile(self, profile: dict) -> dict:
+        """Queue one profile (values, hyperlinks and change notes); sent on flush()"""
         key = profile["NICK NAME"].lower()
         row_values = [profile.get(col, "") for col in COLUMN_ORDER]
+        row_data = self._row_data(profile, row_values)
         existing = self.existing.get(key)
 
         if existing:
@@ -483,224 +995,304 @@ class ProfilesDataSheet:
             for i, (old, new) in enumerate(zip(before, row_values)):
                 if old != new and COLUMN_ORDER[i] not in HIGHLIGHT_EXCLUDE_COLUMNS:
                     changed.append(i)
-            # Update row values
-            self.ws.update(range_name=f"A{existing['row']}:R{existing['row']}", values=[row_values])
-            self._update_links(existing['row'], profile)
-            if changed:
-                self._add_notes(existing['row'], changed, before, row_values)
+            row = existing['row']
+            if existing["synced"]:
+                # Rewrite only cells whose value differs (a short sheet row counts as blanks)
+                differing = [i for i, new in enumerate(row_values) if (before[i] if i < len(before) else "") != new]
+            else:
+                # First write of a cached row: rewrite it whole in case it was edited outside the bot
+                differing = list(range(len(COLUMN_ORDER)))
+                existing["synced"] = True
+            reqs = self._cell_requests(row, row_data, differing)
+            reqs += self._note_requests(row, changed, before, row_values)
+            self._requests += reqs
             self.existing[key]['data'] = row_values
+            self._rows[row - 1] = row_values
             status = "updated" if changed else "unchanged"
             result = {"status": status, "changed_fields": [COLUMN_ORDER[i] for i in changed]}
         else:
-            # New profile, append
-            self.ws.append_row(row_values)
-            new_row = self.ws.row_count
-            self._update_links(new_row, profile)
-            self.existing[key] = {'row': new_row, 'data': row_values}
+            # New profile, appended after the last data row (requests in a batch apply in order)
+            self._requests.append({"appendCells": {"sheetId": self.ws.id, "rows": [row_data], "fields": "userEnteredValue"}})
+            new_row = self.next_row
+            self.next_row += 1
+            self.existing[key] = {'row': new_row, 'data': row_values, 'synced': True}
+            self._rows.append(row_values)
             result = {"status": "new", "changed_fields": list(COLUMN_ORDER)}
         
-        time.sleep(SHEET_WRITE_DELAY)
         return result
 
+    @retry_on_rate_limit
+    def flush(self):
+        """Send all queued profile writes in one batchUpdate call"""
+        if self._requests:
+            self.ws.spreadsheet.batch_update({"requests": self._requests})
+            self._requests = []
+
+    def drop_pending(self):
+        """Forget queued writes and reload from the sheet, since row numbers assumed they would land"""
+        self._requests = []
+        self.existing = {}
+        self._load_existing(use_cache=False)
+
 class RunListSheet:
-    def __init__(self, wb):
-        try:
-            self.ws = wb.worksheet(RUNLIST_SHEET_NAME)
-        except WorksheetNotFound:
-            self.ws = wb.add_worksheet(RUNLIST_SHEET_NAME, 10000, 4)
-        if not self.ws.row_values(1):
+    def __init__(self, wb, worksheets: dict, banded=frozenset(), values=None):
+        self.ws = open_worksheet(wb, RUNLIST_SHEET_NAME, 10000, 4, worksheets)
+        self.banded = banded
+        self._pending = []
+        self._new_rows = {}
+        self._load_index(values)
+        if not self._rows or not self._rows[0]:
             self.ws.append_row(RUNLIST_HEADERS)
             self.ws.format("A1:D1", {"backgroundColor": {"red": 0.9, "green": 0.9, "blue": 0.9}, "textFormat": {"bold": True}})
-        self.apply_banding()
+            self._rows = [list(RUNLIST_HEADERS)] + self._rows[1:]
+            self.next_row = max(self.next_row, 2)
 
-    def apply_banding(self):
-        try:
-            banding_request = {
-                "addBanding": {
-                    "bandedRange": {
-                        "range": {"startRowIndex": 1, "endRowIndex": None, "startColumnIndex": 0, "endColumnIndex": 4},
-                        "rowProperties": {
-                            "firstBandColor": {"red": 1.0, "green": 1.0, "blue": 1.0},
-                            "secondBandColor": {"red": 0.95, "green": 0.95, "blue": 0.95},
-                        }
-                    }
-                }
-            }
-            self.ws.batch_update([banding_request])
-        except Exception:
-            pass
+    @retry_on_rate_limit
+    def _load_index(self, values=None):
+        """Snapshot the sheet once (or use prefetched values) and map lower-cased nickname -> sheet row; kept current in memory"""
+        self._rows = values if values is not None else self.ws.get_all_values()
+        self.row_by_nick = {row[0].lower(): idx for idx, row in enumerate(self._rows[1:], start=2) if row and row[0]}
+        self.next_row = len(self._rows) + 1
+
+    def banding_requests(self) -> list:
+        return row_banding_requests(self.ws, 4, self.banded)
 
     def get_pending_nicknames(self):
-        data = self.ws.get_all_values()
-        return [row[0] for row in data[1:] if row and row[1].lower() == "pending"]
+        return [row[0] for row in self._rows[1:] if len(row) > 1 and row[1].lower() == "pending"]
 
     def update_status(self, nickname: str, status: str, remarks: str, source: str):
-        data = self.ws.get_all_values()
-        for idx, row in enumerate(data[1:], start=2):
-            if row[0].lower() == nickname.lower():
-                self.ws.update(range_name=f"B{idx}:D{idx}", values=[[status, remarks, source]])
-                time.sleep(SHEET_WRITE_DELAY)
-                return
-        # New entry if not found
-        self.ws.append_row([nickname, status, remarks, source])
-        time.sleep(SHEET_WRITE_DELAY)
+        """Queue a status update; written on flush()"""
+        key = nickname.lower()
+        row = self.row_by_nick.get(key)
+        if row:
+            self._pending.append({"range": f"B{row}:D{row}", "values": [[status, remarks, source]]})
+            self._rows[row - 1][1:4] = [status, remarks, source]
+        else:
+            # New entry (or a newer status for one not yet appended)
+            self._new_rows[key] = [nickname, status, remarks, source]
+
+    @retry_on_rate_limit
+    def flush(self):
+        """Write queued status updates and new entries (one call each)"""
+        if self._pending:
+            self.ws.batch_update(self._pending)
+            self._pending = []
+        if self._new_rows:
+            self.ws.append_rows(list(self._new_rows.values()))
+            for key, values in self._new_rows.items():
+                self.row_by_nick[key] = self.next_row
+                self.next_row += 1
+                self._rows.append(values)
+            self._new_rows = {}
+
+    def drop_pending(self):
+        """Forget queued status updates and new entries (rows are only indexed once appended)"""
+        self._pending = []
+        self._new_rows = {}
 
 class CheckListSheet:
-    def __init__(self, wb):
-        try:
-            self.ws = wb.worksheet(CHECKLIST_SHEET_NAME)
-        except WorksheetNotFound:
-            self.ws = wb.add_worksheet(CHECKLIST_SHEET_NAME, 100, 2)
-        if not self.ws.row_values(1):
+    def __init__(self, wb, worksheets: dict, banded=frozenset(), values=None):
+        self.ws = open_worksheet(wb, CHECKLIST_SHEET_NAME, 100, 2, worksheets)
+        self.banded = banded
+        if values is None:
+            values = [self.ws.row_values(1)]
+        if not values or not values[0]:
             self.ws.append_row(CHECKLIST_HEADERS)
             self.ws.format("A1:B1", {"backgroundColor": {"red": 0.9, "green": 0.9, "blue": 0.9}, "textFormat": {"bold": True}})
-        self.apply_banding()
 
-    def apply_banding(self):
-        try:
-            banding_request = {
-                "addBanding": {
-                    "bandedRange": {
-                        "range": {"startRowIndex": 1, "endRowIndex": None, "startColumnIndex": 0, "endColumnIndex": 2},
-                        "rowProperties": {
-                            "firstBandColor": {"red": 1.0, "green": 1.0, "blue": 1.0},
-                            "secondBandColor": {"red": 0.95, "green": 0.95, "blue": 0.95},
-                        }
-                    }
-                }
-            }
-            self.ws.batch_update([banding_request])
-        except Exception:
-            pass
+    def banding_requests(self) -> list:
+        return row_banding_requests(self.ws, 2, self.banded)
 
 class DashboardSheet:
-    def __init__(self, wb):
-        try:
-            self.ws = wb.worksheet(DASHBOARD_SHEET_NAME)
-        except WorksheetNotFound:
-            self.ws = wb.add_worksheet(DASHBOARD_SHEET_NAME, 20, 2)
-        if not self.ws.row_values(1):
+    def __init__(self, wb, worksheets: dict, values=None):
+        self.ws = open_worksheet(wb, DASHBOARD_SHEET_NAME, 20, 2, worksheets)
+        self._load_metrics(values)
+        if self.next_row == 1:
             headers = ["Metric", "Value"]
             self.ws.append_row(headers)
             self.ws.format("A1:B1", {"backgroundColor": {"red": 0.9, "green": 0.9, "blue": 0.9}, "textFormat": {"bold": True}})
+            self.next_row = 2
+
+    @retry_on_rate_limit
+    def _load_metrics(self, values=None):
+        """Map metric name -> sheet row and current value, loaded once"""
+        data = values if values is not None else self.ws.get_all_values()
+        self.metric_row = {row[0]: idx for idx, row in enumerate(data, start=1) if row and row[0]}
+        self.metric_value = {row[0]: (row[1] if len(row) > 1 else "") for row in data[1:] if row and row[0]}
+        self.next_row = len(data) + 1
 
     def get_current_run_number(self):
-        data = self.ws.get_all_values()
-        for row in data[1:]:
-            if row and row[0] == "Run Number":
-                try:
-                    return int(row[1])
-                except ValueError:
-                    return 0
-        return 0
+        try:
+            return int(self.metric_value.get("Run Number", 0))
+        except ValueError:
+            return 0
 
+    @retry_on_rate_limit
     def update(self, metrics: dict):
-        data = self.ws.get_all_values()
-        existing = {row[0]: idx for idx, row in enumerate(data) if row and len(row) > 0}
-        for key, value in metrics.items():
-            if key in existing:
-                row = existing[key] + 1
-                self.ws.update_cell(row, 2, value)
-            else:
-                self.ws.append_row([key, value])
-        time.sleep(SHEET_WRITE_DELAY)
+        """Write changed metrics: one batch update for known rows, one append for new metrics"""
+        ranges = [{"range": f"B{self.metric_row[key]}", "values": [[value]]}
+                  for key, value in metrics.items()
+                  if key in self.metric_row and str(value) != str(self.metric_value.get(key, ""))]
+        new_rows = [[key, value] for key, value in metrics.items() if key not in self.metric_row]
+        if ranges:
+            self.ws.batch_update(ranges, value_input_option="USER_ENTERED")
+        if new_rows:
+            self.ws.append_rows(new_rows)
+            for key, _ in new_rows:
+                self.metric_row[key] = self.next_row
+                self.next_row += 1
+        self.metric_value.update(metrics)
 
 class NickListSheet:
-    def __init__(self, wb):
-        try:
-            self.ws = wb.worksheet(NICK_LIST_SHEET)
-        except WorksheetNotFound:
-            self.ws = wb.add_worksheet(NICK_LIST_SHEET, 10000, 4)
-        if not self.ws.row_values(1):
+    def __init__(self, wb, worksheets: dict, banded=frozenset(), values=None):
+        self.ws = open_worksheet(wb, NICK_LIST_SHEET, 10000, 4, worksheets)
+        self.banded = banded
+        if values is None:
+            values = self._get_all_values()
+        if not values or not values[0]:
             self.ws.append_row(NICK_LIST_HEADERS)
             self.ws.format("A1:D1", {"backgroundColor": {"red": 0.9, "green": 0.9, "blue": 0.9}, "textFormat": {"bold": True}})
-        self.apply_banding()
-        self.existing = self._load_existing()
+            values = [list(NICK_LIST_HEADERS)] + values[1:]
+        self.existing = self._load_existing(values)
+        self._new_rows = {}
+        self._mod_rows = {}
 
-    def apply_banding(self):
-        try:
-            banding_request = {
-                "addBanding": {
-                    "bandedRange": {
-                        "range": {"startRowIndex": 1, "endRowIndex": None, "startColumnIndex": 0, "endColumnIndex": 4},
-                        "rowProperties": {
-                            "firstBandColor": {"red": 1.0, "green": 1.0, "blue": 1.0},
-                            "secondBandColor": {"red": 0.95, "green": 0.95, "blue": 0.95},
-                        }
-                    }
-                }
-            }
-            self.ws.batch_update([banding_request])
-        except Exception:
-            pass
+    def banding_requests(self) -> list:
+        return row_banding_requests(self.ws, 4, self.banded)
 
-    def _load_existing(self):
-        data = self.ws.get_all_values()
-        return {row[0].lower(): {"row": idx+1, "times": int(row[1]), "first": row[2], "last": row[3]} 
-                for idx, row in enumerate(data[1:]) if row and row[0]}
+    @retry_on_rate_limit
+    def _get_all_values(self):
+        return self.ws.get_all_values()
+
+    def _load_existing(self, data: list) -> dict:
+        self.next_row = len(data) + 1
+        return {row[0].lower(): {"row": idx, "times": int(row[1]), "first": row[2], "last": row[3]} 
+                for idx, row in enumerate(data[1:], start=2) if row and row[0]}
 
     def record_seen(self, nickname: str):
-        now = get_pkt_time().strftime("%d-%b-%y %I:%M %p")
+        """Record a sighting in memory; written on flush()"""
+        now = pkt_timestamp()
         key = nickname.lower()
-        if key in self.existing:
-            entry = self.existing[key]
-            new_times = entry["times"] + 1
-            self.ws.update_cell(entry["row"] + 1, 2, new_times)
-            self.ws.update_cell(entry["row"] + 1, 4, now)
-            self.existing[key]["times"] = new_times
-            self.existing[key]["last"] = now
+        entry = self.existing.get(key)
+        if entry is None:
+            self.existing[key] = {"row": None, "times": 1, "first": now, "last": now}
+            self._new_rows[key] = [nickname, 1, now, now]
+        elif key in self._new_rows:
+            # Seen again before its row was appended
+            entry["times"] += 1
+            entry["last"] = now
+            self._new_rows[key][1:] = [entry["times"], entry["first"], now]
         else:
-            new_row = [nickname, 1, now, now]
-            self.ws.append_row(new_row)
-            self.existing[key] = {"row": self.ws.row_count - 1, "times": 1, "first": now, "last": now}
-        time.sleep(SHEET_WRITE_DELAY)
+            entry["times"] += 1
+            entry["last"] = now
+            self._mod_rows[entry["row"]] = [entry["times"], entry["first"], now]
+
+    @retry_on_rate_limit
+    def flush(self):
+        """Append new nicknames and write updated sightings (one call each, repeats collapsed)"""
+        if self._new_rows:
+            self.ws.append_rows(list(self._new_rows.values()), value_input_option="USER_ENTERED")
+            for key in self._new_rows:
+                self.existing[key]["row"] = self.next_row
+                self.next_row += 1
+            self._new_rows = {}
+        if self._mod_rows:
+            self.ws.batch_update([{"range": f"B{row}:D{row}", "values": [values]}
+                                  for row, values in self._mod_rows.items()],
+                                 value_input_option="USER_ENTERED")
+            self._mod_rows = {}
+
+    def drop_pending(self):
+        """Forget queued sightings and reload the counts from the sheet"""
+        self._new_rows = {}
+        self._mod_rows = {}
+        self.existing = self._load_existing(self._get_all_values())
 
 class TimingLogSheet:
-    def __init__(self, wb):
-        try:
-            self.ws = wb.worksheet(TIMING_LOG_SHEET_NAME)
-        except WorksheetNotFound:
-            self.ws = wb.add_worksheet(TIMING_LOG_SHEET_NAME, 10000, 4)
-        if not self.ws.row_values(1):
+    def __init__(self, wb, worksheets: dict, banded=frozenset(), values=None):
+        self.ws = open_worksheet(wb, TIMING_LOG_SHEET_NAME, 10000, 4, worksheets)
+        self.banded = banded
+        if values is None:
+            values = [self.ws.row_values(1)]
+        if not values or not values[0]:
             self.ws.append_row(TIMING_LOG_HEADERS)
             self.ws.format("A1:D1", {"backgroundColor": {"red": 0.9, "green": 0.9, "blue": 0.9}, "textFormat": {"bold": True}})
-        self.apply_banding()
+        self._pending = []
 
-    def apply_banding(self):
-        try:
-            banding_request = {
-                "addBanding": {
-                    "bandedRange": {
-                        "range": {"startRowIndex": 1, "endRowIndex": None, "startColumnIndex": 0, "endColumnIndex": 4},
-                        "rowProperties": {
-                            "firstBandColor": {"red": 1.0, "green": 1.0, "blue": 1.0},
-                            "secondBandColor": {"red": 0.95, "green": 0.95, "blue": 0.95},
-                        }
-                    }
-                }
-            }
-            self.ws.batch_update([banding_request])
-        except Exception:
-            pass
+    def banding_requests(self) -> list:
+        return row_banding_requests(self.ws, 4, self.banded)
 
     def log_scrape(self, nickname: str, timestamp: str, source: str, run_number: int):
-        row = [nickname, timestamp, source, run_number]
-        self.ws.append_row(row)
-        time.sleep(SHEET_WRITE_DELAY)
+        """Queue a timing record; appended on flush()"""
+        self._pending.append([nickname, timestamp, source, run_number])
+
+    @retry_on_rate_limit
+    def flush(self):
+        """Append all queued timing records in one call"""
+        if self._pending:
+            self.ws.append_rows(self._pending)
+            self._pending = []
+
+    def drop_pending(self):
+        self._pending = []
+
+# Ranges read at startup in one batchGet (None = whole sheet); ProfilesData is loaded separately via its local cache
+PREFETCH_RANGES = {RUNLIST_SHEET_NAME: None, CHECKLIST_SHEET_NAME: "1:1", DASHBOARD_SHEET_NAME: None,
+                   NICK_LIST_SHEET: None, TIMING_LOG_SHEET_NAME: "1:1"}
 
 class Sheets:
     def __init__(self, client):
         self.wb = client.open_by_url(SHEET_URL)
-        self.profiles = ProfilesDataSheet(self.wb)
-        self.runlist = RunListSheet(self.wb)
-        self.checklist = CheckListSheet(self.wb)
-        self.dashboard = DashboardSheet(self.wb)
-        self.nicklist = NickListSheet(self.wb)
-        self.timinglog = TimingLogSheet(self.wb)
+        worksheets, banded = self._load_sheet_metadata()
+        values = self._prefetch_values(worksheets)
+        self.profiles = ProfilesDataSheet(self.wb, worksheets, banded)
+        self.runlist = RunListSheet(self.wb, worksheets, banded, values.get(RUNLIST_SHEET_NAME))
+        self.checklist = CheckListSheet(self.wb, worksheets, banded, values.get(CHECKLIST_SHEET_NAME))
+        self.dashboard = DashboardSheet(self.wb, worksheets, values.get(DASHBOARD_SHEET_NAME))
+        self.nicklist = NickListSheet(self.wb, worksheets, banded, values.get(NICK_LIST_SHEET))
+        self.timinglog = TimingLogSheet(self.wb, worksheets, banded, values.get(TIMING_LOG_SHEET_NAME))
+        self._apply_banding()
+
+    def _apply_banding(self):
+        """Send the header/banding setup of every sheet that still lacks it in one batchUpdate"""
+        requests = [req for sheet in (self.profiles, self.runlist, self.checklist, self.nicklist, self.timinglog)
+                    for req in sheet.banding_requests()]
+        if not requests:
+            return
+        try:
+            self.wb.batch_update({"requests": requests})
+        except Exception:
+            pass
+
+    def _load_sheet_metadata(self) -> tuple:
+        """All worksheets by title and the titles that already have banding (one metadata call)"""
+        try:
+            meta = self.wb.fetch_sheet_metadata(params={"fields": "sheets(properties,bandedRanges(bandedRangeId))"})
+        except Exception:
+            return {}, set()
+        sheets = meta.get("sheets", [])
+        worksheets = {s["properties"]["title"]: gspread.Worksheet(self.wb, s["properties"]) for s in sheets}
+        banded = {s["properties"]["title"] for s in sheets if s.get("bandedRanges")}
+        return worksheets, banded
+
+    def _prefetch_values(self, worksheets: dict) -> dict:
+        """Startup reads of every sheet except ProfilesData in one values batchGet; {} on failure (sheets then read themselves)"""
+        titles = [title for title in PREFETCH_RANGES if title in worksheets]
+        if not titles:
+            return {}
+        try:
+            resp = self.wb.values_batch_get([absolute_range_name(title, PREFETCH_RANGES[title]) for title in titles])
+        except Exception:
+            return {}
+        # Pad rows to equal length, as get_all_values does
+        return {title: fill_gaps(vr.get("values", [])) for title, vr in zip(titles, resp.get("valueRanges", []))}
 
     def get_pending_nicknames(self):
         return self.runlist.get_pending_nicknames()
 
+    def reload_runlist(self):
+        self.runlist._load_index()
+
     def update_runlist_status(self, nickname: str, status: str, remarks: str, source: str):
         self.runlist.update_status(nickname, status, remarks, source)
 
@@ -716,68 +1308,92 @@ class Sheets:
     def update_dashboard(self, metrics: dict):
         self.dashboard.update(metrics)
 
+    def flush(self) -> set:
+        """Send all buffered ProfilesData, NickList, RunList and TimingLog writes
+
+        A batch rejected with a non-retryable error is dropped so it can't block every later flush;
+        the titles of dropped sheets are returned. Retryable errors are raised once every sheet was tried.
+        """
+        dropped = set()
+        error = None
+        for sheet in (self.profiles, self.nicklist, self.runlist, self.timinglog):
+            try:
+                sheet.flush()
+            except APIError as e:
+                status = api_status(e)
+                if status in RETRYABLE_STATUS_CODES:
+                    error = error or e
+                    continue
+                log_msg(f"🗑️ {sheet.ws.title}: dropping batch rejected by Sheets ({status}): {str(e)[:80]}")
+                sheet.drop_pending()
+                dropped.add(sheet.ws.title)
+        if error:
+            raise error
+        return dropped
+
+    def save_cache(self):
+        self.profiles.save_cache()
+
 # ============================================================================
 # SCRAPING FUNCTIONS
 # ============================================================================
 
-def fetch_online_nicknames(driver):
-    """Fetch list of currently online users"""
+def parse_online_profiles(tree) -> dict:
+    """Extract {nickname: profile URL} from a parsed online users page (URL is None if not linked)"""
+    profiles = {}
+    for b in css("li.mbl.cl.sp b")(tree):
+        nick = b.text_content().strip()
+        if NICK_RE.match(nick):
+            hrefs = xpath("ancestor::li[1]//a[contains(@href, '/users/')]/@href")(b)
+            profiles[nick] = to_absolute_url(hrefs[0]) if hrefs else None
+
+    if not profiles:
+        for href in xpath("//a[contains(@href, '/users/')]/@href")(tree):
+            nick = href.split('/users/')[-1].rstrip('/')
+            if nick and nick not in profiles and ALPHA_RE.search(nick):
+                profiles[nick] = to_absolute_url(href)
+    return profiles
+
+def fetch_online_profiles(driver, session=None) -> dict:
+    """Fetch currently online users as {nickname: profile URL} (HTTP first, browser as fallback)"""
     log_msg("👥 Fetching online users...")
-    driver.get(ONLINE_URL)
-    time.sleep(2)
-    names = []
-    try:
-        items = driver.find_elements(By.CSS_SELECTOR, "li.mbl.cl.sp b")
-        for b in items:
-            nick = (b.text or '').strip()
-            if nick and len(nick) >= 3 and any(ch.isalpha() for ch in nick):
-                names.append(nick)
-    except Exception:
-        pass
-    
-    if not names:
-        links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/users/']")
-        for a in links:
-            href = a.get_attribute('href') or ''
-            if '/users/' in href:
-                nick = href.split('/users/')[-1].rstrip('/')
-                if nick and nick not in names and any(ch.isalpha() for ch in nick):
-                    names.append(nick)
+    profiles = {}
+    html = fetch_html(session, ONLINE_URL) if session else None
+    if html:
+        profiles = parse_online_profiles(lxml.html.fromstring(html))
+
+    if not profiles:
+        with _driver_lock:
+            wait_for_request_slot()
+            driver.get(ONLINE_URL)
+            try:
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "li.mbl.cl.sp b, a[href*='/users/']")))
+            except TimeoutException:
+                pass  # parse whatever loaded; parse_online_profiles falls back to any /users/ links
+            profiles = parse_online_profiles(lxml.html.fromstring(driver.page_source))
     
-    log_msg(f"✅ Found {len(names)} online users")
-    return names
-
-def scrape_profile(driver, nickname: str) -> dict | None:
-    """Scrape complete profile information"""
-    url = f"https://damadam.pk/users/{nickname}/"
+    log_msg(f"✅ Found {len(profiles)} online users")
+    return profiles
+
+def scrape_profile(driver, session, nickname: str, url: str | None = None) -> dict | None:
+    """Scrape complete profile information (url: profile link from the online list, if known)"""
+    # PROFILE LINK is always the canonical form so stored rows don't change with the list's href; that href is only fetched
+    link = f"{BASE_URL}/users/{nickname}"
+    url = url or link + "/"
     try:
         log_msg(f"📍 Scraping: {nickname}")
-        driver.get(url)
-        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, "h1.cxl.clb.lsp")))
-
-        page_source = driver.page_source
-        now = get_pkt_time()
-        suspend_reason = detect_suspension_reason(page_source)
+        _, tree = fetch_page(driver, session, url, "h1.cxl.clb.lsp")
+        # Suspension and verification markers live in the header block, so scan only that slice
+        header = profile_header(tree)
+        header_text = header.text_content()
+        suspend_reason = detect_suspension_reason(header_text)
         
         data = {
-            "IMAGE": "",
+            **PROFILE_TEMPLATE,
             "NICK NAME": nickname,
-            "TAGS": "",
-            "LAST POST": "",
-            "LAST POST TIME": "",
-            "FRIEND": "",
-            "CITY": "",
-            "GENDER": "",
-            "MARRIED": "",
-            "AGE": "",
-            "JOINED": "",
-            "FOLLOWERS": "",
-            "STATUS": "",
-            "POSTS": "",
-            "PROFILE LINK": url.rstrip('/'),
-            "INTRO": "",
-            "SOURCE": "Online",
-            "DATETIME SCRAP": now.strftime("%d-%b-%y %I:%M %p"),
+            "PROFILE LINK": link,
+            "DATETIME SCRAP": pkt_timestamp(),
         }
 
         if suspend_reason:
@@ -787,90 +1403,52 @@ def scrape_profile(driver, nickname: str) -> dict | None:
             return data
 
         # Check verification status
-        if 'account suspended' in page_source.lower():
+        if 'account suspended' in header_text.lower():
             data['STATUS'] = f"{EMOJI_UNVERIFIED} Suspended"
-        elif 'background:tomato' in page_source or 'style=\"background:tomato\"' in page_source.lower():
+        elif xpath("boolean(descendant-or-self::*[contains(@style, 'tomato')])")(header):
             data['STATUS'] = f"{EMOJI_UNVERIFIED}"
         else:
-            try:
-                driver.find_element(By.CSS_SELECTOR, "div[style*='tomato']")
-                data['STATUS'] = f"{EMOJI_UNVERIFIED}"
-            except Exception:
-                data['STATUS'] = f"{EMOJI_VERIFIED}"
+            data['STATUS'] = f"{EMOJI_VERIFIED}"
 
-        data['FRIEND'] = get_friend_status(driver)
+        data['FRIEND'] = get_friend_status(tree)
 
         # Extract intro
         for sel in ["span.cl.sp.lsp.nos", "span.cl", ".ow span.nos"]:
-            try:
-                intro = driver.find_element(By.CSS_SELECTOR, sel)
-                if intro.text.strip():
-                    data['INTRO'] = clean_text(intro.text)
-                    break
-            except Exception:
-                pass
+            intro = css(sel)(tree)
+            if intro and intro[0].text_content().strip():
+                data['INTRO'] = clean_text(intro[0].text_content())
+                break
 
         # Extract profile fields
-        fields = {'City:': 'CITY', 'Gender:': 'GENDER', 'Married:': 'MARRIED', 'Age:': 'AGE', 'Joined:': 'JOINED'}
-        for label, key in fields.items():
-            try:
-                elem = driver.find_element(By.XPATH, f"//b[contains(text(), '{label}')]/following-sibling::span[1]")
-                value = elem.text.strip()
-                if not value:
-                    continue
-                if key == 'JOINED':
-                    data[key] = convert_relative_date_to_absolute(value)
-                elif key == 'GENDER':
-                    low = value.lower()
-                    data[key] = "💃" if 'female' in low else "👨" if 'male' in low else ""
-                elif key == 'MARRIED':
-                    low = value.lower()
-                    if low in {'yes', 'married'}:
-                        data[key] = f"{EMOJI_MARRIED_YES}"
-                    elif low in {'no', 'single', 'unmarried'}:
-                        data[key] = f"{EMOJI_MARRIED_NO}"
-                    else:
-                        data[key] = value
-                else:
-                    data[key] = clean_data(value)
-            except Exception:
-                continue
+        for key, value in extract_profile_fields(tree).items():
+            if value:
+                data[key] = PROFILE_FIELD_HANDLERS.get(key, clean_data)(value)
 
         # Extract followers
         for sel in ["span.cl.sp.clb", ".cl.sp.clb"]:
-            try:
-                followers = driver.find_element(By.CSS_SELECTOR, sel)
-                match = re.search(r'(\d+)', followers.text)
-                if match:
-                    data['FOLLOWERS'] = match.group(1)
-                    break
-            except Exception:
-                pass
+            followers = css(sel)(tree)
+            match = DIGITS_RE.search(followers[0].text_content()) if followers else None
+            if match:
+                data['FOLLOWERS'] = match.group()
+                break
 
         # Extract posts count
         for sel in ["a[href*='/profile/public/'] button div:first-child", "a[href*='/profile/public/'] button div"]:
-            try:
-                posts = driver.find_element(By.CSS_SELECTOR, sel)
-                match = re.search(r'(\d+)', posts.text)
-                if match:
-                    data['POSTS'] = match.group(1)
-                    break
-            except Exception:
-                pass
+            posts = css(sel)(tree)
+            match = DIGITS_RE.search(posts[0].text_content()) if posts else None
+            if match:
+                data['POSTS'] = match.group()
+                break
 
         # Extract image
-        for sel in ["img[src*='avatar-imgs']", "img[src*='avatar']", "div[style*='whitesmoke'] img[src*='cloudfront.net']"]:
-            try:
-                img = driver.find_element(By.CSS_SELECTOR, sel)
-                src = img.get_attribute('src')
-                if src and ('avatar' in src or 'cloudfront.net' in src):
-                    data['IMAGE'] = src.replace('/thumbnail/', '/')
-                    break
-            except Exception:
-                pass
+        srcs = xpath(PROFILE_IMAGE_XPATH)(tree)
+        # Same preference as separate lookups: avatar-imgs, then any avatar, then the whitesmoke card image
+        src = min(srcs, key=lambda s: 0 if 'avatar-imgs' in s else 1 if 'avatar' in s else 2, default="")
+        if src:
+            data['IMAGE'] = to_absolute_url(src).replace('/thumbnail/', '/')
 
         # Extract recent post
-        post_data = scrape_recent_post(driver, nickname)
+        post_data = scrape_recent_post(driver, session, nickname)
         if post_data.get('LPOST'):
             data['LAST POST'] = post_data['LPOST']
         if post_data.get('LDATE-TIME'):
@@ -887,51 +1465,132 @@ def scrape_profile(driver, nickname: str) -> dict | None:
         log_msg(f"❌ Error scraping {nickname}: {str(e)[:50]}")
         return None
 
+def scrape_profiles(driver, session, nicknames: list, profile_urls: dict):
+    """Yield (nickname, profile) in input order while up to SCRAPE_WORKERS profiles are scraped ahead"""
+    nick_iter = iter(nicknames)
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=max(1, SCRAPE_WORKERS)) as pool:
+        def submit(nick):
+            pending.append((nick, pool.submit(scrape_profile, driver, session, nick, profile_urls.get(nick))))
+
+        try:
+            for nick in nick_iter:
+                submit(nick)
+                if len(pending) >= SCRAPE_WORKERS:
+                    break
+            while pending:
+                nick, future = pending.popleft()
+                next_nick = next(nick_iter, None)
+                if next_nick is not None:
+                    submit(next_nick)
+                yield nick, future.result()
+        finally:
+            # Loop stopped early (limit reached / error): drop work that has not started
+            for _, future in pending:
+                future.cancel()
+
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
 
-def main():
-    """Main execution function"""
-    parser = argparse.ArgumentParser(description="DamaDam Scraper")
-    parser.add_argument('--limit', type=int, default=None, help='Max profiles per run (overrides .env)')
-    args = parser.parse_args()
+# Set by Ctrl-C / SIGTERM: the current run stops after the profile in hand and the idle wait ends at once
+_stop_event = threading.Event()
 
-    global MAX_PROFILES_PER_RUN
-    if args.limit is not None:
-        MAX_PROFILES_PER_RUN = args.limit
+def request_stop(signum, frame):
+    """Signal handler: finish gracefully on the first signal, abort on the second"""
+    if _stop_event.is_set():
+        raise KeyboardInterrupt
+    log_msg("🛑 Stop requested, finishing current profile...")
+    _stop_event.set()
 
-    print("\n" + "="*80)
-    print("🚀 DamaDam Master Bot v1.0.202 - Starting")
-    print("="*80 + "\n")
-    
-    start_time = time.time()
-    run_start = get_pkt_time()
-    
-    # Check run mode
-    run_mode = os.getenv('RUN_MODE', 'online').lower()
-    log_msg(f"📋 Run Mode: {run_mode.upper()}")
-    
-    # Initialize
-    log_msg("⚙️ Initializing...")
+def start_browser_session():
+    """Launch Chrome, log in and build the HTTP session; (None, None) on failure"""
     driver = setup_browser()
     if not driver:
         log_msg("❌ Failed to setup browser")
-        return
-    
+        return None, None
     if not login(driver):
         log_msg("❌ Failed to login")
         driver.quit()
-        return
-    
+        return None, None
+    return driver, build_http_session(driver)
+
+def quit_browser(driver):
+    """Close Chrome, ignoring errors from an already-dead session"""
     try:
-        client = gsheets_client()
-        sheets = Sheets(client)
-    except Exception as e:
-        log_msg(f"❌ Google Sheets error: {e}")
         driver.quit()
-        return
-    
+    except WebDriverException:
+        pass
+
+def browser_alive(driver) -> bool:
+    """True if the Chrome session still responds"""
+    try:
+        driver.current_url
+        return True
+    except WebDriverException:
+        return False
+
+def refresh_browser_session(driver, session):
+    """Restart Chrome if it died or is missing and log in again if the session expired. Returns (driver, session).
+    Nothing is given up on: session is None while logged out and driver is None while Chrome could not be
+    started, and both are retried on the next call. A failed login check keeps the current session."""
+    if not driver or not browser_alive(driver):
+        if driver:
+            log_msg("🔄 Browser session lost, restarting...")
+            quit_browser(driver)
+        return start_browser_session()
+    if session:
+        logged_in = session_logged_in(session)
+        if logged_in is None:
+            log_msg("⚠️ Could not reach the site to check the login, keeping the current session")
+            return driver, session
+        if logged_in:
+            return driver, session
+        log_msg("🔄 Session expired, logging in again...")
+    if not login(driver):
+        log_msg("⚠️ Login failed, will retry at the next check")
+        return driver, None
+    return driver, build_http_session(driver)
+
+def idle_between_runs(driver, session, seconds: float):
+    """Wait between auto-repeat runs, checking the browser and login every KEEPALIVE_INTERVAL
+    so an expired session is renewed before the next run needs it. Returns (driver, session)."""
+    deadline = time.monotonic() + seconds
+    while (remaining := deadline - time.monotonic()) > 0:
+        if _stop_event.wait(min(KEEPALIVE_INTERVAL, remaining)):
+            break
+        driver, session = refresh_browser_session(driver, session)
+    return driver, session
+
+def flush_batch(sheets, batch: list, metrics: dict, run_mode: str) -> bool:
+    """Flush buffered sheet writes for the profiles in batch; True once nothing is left queued
+
+    Failures are reported for the batch as a whole, not blamed on whichever profile triggered the flush.
+    """
+    try:
+        dropped = sheets.flush()
+    except Exception as e:
+        if isinstance(e, APIError):
+            adaptive.on_rate_limit(retry_after_seconds(e))
+        log_msg(f"❌ Sheet batch write failed, {len(batch)} profiles kept for the next flush: {str(e)[:80]}")
+        return False
+    if PROFILES_SHEET_NAME in dropped and batch:
+        log_msg(f"❌ {len(batch)} profiles in the rejected batch were not saved")
+        metrics["Success"] -= len(batch)
+        metrics["Failed"] += len(batch)
+        if run_mode == 'sheet':
+            for nickname in batch:
+                sheets.update_runlist_status(nickname, "Failed", "Sheet error: batch rejected", "Online")
+            batch.clear()
+            return flush_batch(sheets, batch, metrics, run_mode)
+    batch.clear()
+    return True
+
+def run_once(driver, session, sheets, run_mode: str):
+    """Scrape one run's profiles and update the sheets"""
+    start_time = time.time()
+    run_start = get_pkt_time()
+
     # Get run number
     run_number = sheets.dashboard.get_current_run_number() + 1
     
@@ -939,30 +1598,45 @@ def main():
     if run_mode == 'sheet':
         log_msg("📄 Reading from RunList sheet...")
         online_nicknames = sheets.get_pending_nicknames()
+        profile_urls = {}
         if not online_nicknames:
             log_msg("⚠️ No pending nicknames in RunList")
-            driver.quit()
             return
     else:
         # Fetch online users (default mode)
         try:
-            online_nicknames = fetch_online_nicknames(driver)
+            profile_urls = fetch_online_profiles(driver, session)
+            online_nicknames = list(profile_urls)
         except Exception as e:
             log_msg(f"❌ Failed to fetch online users: {e}")
-            driver.quit()
             return
         
         if not online_nicknames:
             log_msg("⚠️ No online users found")
-            driver.quit()
             return
+
+        if FRESH_TTL > 0:
+            # Still count the sighting, but don't re-scrape profiles that were just updated
+            cutoff = run_start.replace(tzinfo=None) - timedelta(minutes=FRESH_TTL)
+            fresh = {nick for nick in online_nicknames if sheets.profiles.scraped_since(nick, cutoff)}
+            if fresh:
+                for nick in fresh:
+                    sheets.record_nick_seen(nick)
+                online_nicknames = [nick for nick in online_nicknames if nick not in fresh]
+                log_msg(f"⏭️ Skipping {len(fresh)} profiles scraped in the last {FRESH_TTL} minutes")
     
+    # Apply the per-run limit up front so the workers never fetch profiles that would be discarded
+    if 0 < MAX_PROFILES_PER_RUN < len(online_nicknames):
+        log_msg(f"⏹️ Limiting run to {MAX_PROFILES_PER_RUN} of {len(online_nicknames)} profiles")
+        online_nicknames = online_nicknames[:MAX_PROFILES_PER_RUN]
+
     # Process profiles
-    log_msg(f"\n📊 Processing {len(online_nicknames)} profiles...\n")
+    total = len(online_nicknames)
+    log_msg(f"\n📊 Processing {total} profiles...\n")
     
     metrics = {
         "Run Number": run_number,
-        "Last Run": run_start.strftime("%d-%b-%y %I:%M %p"),
+        "Last Run": run_start.strftime(DATETIME_FORMAT),
         "Profiles Processed": 0,
         "Success": 0,
         "Failed": 0,
@@ -970,82 +1644,94 @@ def main():
         "Updated Profiles": 0,
         "Unchanged Profiles": 0,
         "Trigger": os.getenv('GITHUB_EVENT_NAME', 'manual'),
-        "Start": run_start.strftime("%d-%b-%y %I:%M %p"),
+        "Start": run_start.strftime(DATETIME_FORMAT),
     }
     
-    processed = 0
     success_count = 0
+    batch = []  # nicknames written since the last flush
     global adaptive
     adaptive = AdaptiveDelay(MIN_DELAY, MAX_DELAY)
     
-    for idx, nickname in enumerate(online_nicknames, 1):
-        if MAX_PROFILES_PER_RUN > 0 and processed >= MAX_PROFILES_PER_RUN:
-            log_msg(f"⏹️ Reached max profiles limit ({MAX_PROFILES_PER_RUN})")
-            break
-        
-        # Record nickname as seen
-        sheets.record_nick_seen(nickname)
-        
-        # Scrape profile
-        profile = scrape_profile(driver, nickname)
-        if not profile:
-            metrics["Failed"] += 1
-            if run_mode == 'sheet':
-                sheets.update_runlist_status(nickname, "Failed", "Scraping error", "Online")
-            log_msg(f"❌ [{idx}/{len(online_nicknames)}] Failed: {nickname}")
-            adaptive.sleep()
-            continue
+    try:
+        # Profiles are scraped concurrently; results arrive here in order and are written one at a time
+        profiles = scrape_profiles(driver, session, online_nicknames, profile_urls)
+        for idx, (nickname, profile) in enumerate(profiles, 1):
+            # Record nickname as seen
+            sheets.record_nick_seen(nickname)
         
-        # Write to sheet
-        try:
-            result = sheets.write_profile(profile)
-            processed += 1
-            success_count += 1
-            metrics["Profiles Processed"] += 1
-            metrics["Success"] += 1
-            
-            if result["status"] == "new":
-                metrics["New Profiles"] += 1
-                status_mark = "✨"
-            elif result["status"] == "updated":
-                metrics["Updated Profiles"] += 1
-                status_mark = "🔄"
+            note_scrape_result(profile is not None)
+            if not profile:
+                metrics["Failed"] += 1
+                if run_mode == 'sheet':
+                    sheets.update_runlist_status(nickname, "Failed", "Scraping error", "Online")
+                log_msg(f"❌ [{idx}/{total}] Failed: {nickname}")
+                adaptive.sleep()
             else:
-                metrics["Unchanged Profiles"] += 1
-                status_mark = "⏭️"
+                # Write to sheet
+                try:
+                    result = sheets.write_profile(profile)
+                    batch.append(nickname)
+                    success_count += 1
+                    metrics["Profiles Processed"] += 1
+                    metrics["Success"] += 1
             
-            log_msg(f"{status_mark} [{idx}/{len(online_nicknames)}] {result['status'].upper()}: {nickname}")
+                    if result["status"] == "new":
+                        metrics["New Profiles"] += 1
+                        status_mark = "✨"
+                    elif result["status"] == "updated":
+                        metrics["Updated Profiles"] += 1
+                        status_mark = "🔄"
+                    else:
+                        metrics["Unchanged Profiles"] += 1
+                        status_mark = "⏭️"
             
-            # Log to TimingLog
-            sheets.log_scrape(nickname, profile["DATETIME SCRAP"], profile["SOURCE"], run_number)
+                    log_msg(f"{status_mark} [{idx}/{total}] {result['status'].upper()}: {nickname}")
             
-            if run_mode == 'sheet':
-                sheets.update_runlist_status(nickname, "Complete", f"{result['status'].upper()}", "Online")
+                    # Log to TimingLog
+                    sheets.log_scrape(nickname, profile["DATETIME SCRAP"], profile["SOURCE"], run_number)
             
-            # Auto-optimize after sample size
-            if success_count == OPTIMIZATION_SAMPLE_SIZE:
-                adaptive.optimize_batch_size(success_count)
+                    if run_mode == 'sheet':
+                        sheets.update_runlist_status(nickname, "Complete", f"{result['status'].upper()}", "Online")
             
-            adaptive.on_success()
-            adaptive.sleep()
-        except APIError as e:
-            if 'Quota exceeded' in str(e):
-                adaptive.on_rate_limit()
-            metrics["Failed"] += 1
-            log_msg(f"❌ [{idx}/{len(online_nicknames)}] Sheet error: {nickname} - {str(e)[:50]}")
-            if run_mode == 'sheet':
-                sheets.update_runlist_status(nickname, "Failed", f"Sheet error: {str(e)[:50]}", "Online")
-            adaptive.sleep()
-        except Exception as e:
-            metrics["Failed"] += 1
-            log_msg(f"❌ [{idx}/{len(online_nicknames)}] Sheet error: {nickname} - {str(e)[:50]}")
-            if run_mode == 'sheet':
-                sheets.update_runlist_status(nickname, "Failed", f"Sheet error: {str(e)[:50]}", "Online")
-            adaptive.on_rate_limit()
-            adaptive.sleep()
-    
+                    # Auto-optimize after sample size
+                    if success_count == OPTIMIZATION_SAMPLE_SIZE:
+                        adaptive.optimize_batch_size(success_count)
+            
+                    adaptive.on_success()
+                    adaptive.sleep()
+                except APIError as e:
+                    if 'Quota exceeded' in str(e):
+                        adaptive.on_rate_limit(retry_after_seconds(e))
+                    metrics["Failed"] += 1
+                    log_msg(f"❌ [{idx}/{total}] Sheet error: {nickname} - {str(e)[:50]}")
+                    if run_mode == 'sheet':
+                        sheets.update_runlist_status(nickname, "Failed", f"Sheet error: {str(e)[:50]}", "Online")
+                    adaptive.sleep()
+                except Exception as e:
+                    metrics["Failed"] += 1
+                    log_msg(f"❌ [{idx}/{total}] Sheet error: {nickname} - {str(e)[:50]}")
+                    if run_mode == 'sheet':
+                        sheets.update_runlist_status(nickname, "Failed", f"Sheet error: {str(e)[:50]}", "Online")
+                    adaptive.on_rate_limit()
+                    adaptive.sleep()
+
+            # Buffered sheet writes are flushed and rate-limited per batch rather than per call
+            if len(batch) >= adaptive.batch_size:
+                flush_batch(sheets, batch, metrics, run_mode)
+                adaptive.on_batch()
+                time.sleep(SHEET_WRITE_DELAY)
+
+            # Checked only once the result in hand has been written, so a stop never discards a scraped profile
+            if _stop_event.is_set():
+                profiles.close()
+                break
+    finally:
+        # Send any writes still buffered (also on errors/interrupts), then refresh the local profiles cache once
+        if flush_batch(sheets, batch, metrics, run_mode):
+            sheets.save_cache()
+
     # Finalize
-    metrics["End"] = get_pkt_time().strftime("%d-%b-%y %I:%M %p")
+    metrics["End"] = pkt_timestamp()
     sheets.update_dashboard(metrics)
     
     elapsed = time.time() - start_time
@@ -1054,7 +1740,7 @@ def main():
     print("📈 RUN SUMMARY")
     print("="*80)
     print(f"Run Number:         {run_number}")
-    print(f"Total Profiles:     {len(online_nicknames)}")
+    print(f"Total Profiles:     {total}")
     print(f"Processed:          {metrics['Profiles Processed']}")
     print(f"Success:            {metrics['Success']}")
     print(f"Failed:             {metrics['Failed']}")
@@ -1066,7 +1752,90 @@ def main():
     print("="*80 + "\n")
     
     log_msg("✅ Run completed successfully")
-    driver.quit()
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="DamaDam Scraper")
+    parser.add_argument('--limit', type=int, default=None, help='Max profiles per run (overrides .env)')
+    parser.add_argument('--ttl', type=int, default=None, help='Skip online profiles scraped within this many minutes (overrides .env)')
+    parser.add_argument('--profile', action='store_true', help=f'Profile the whole session with cProfile and save {PROFILE_STATS_FILE}')
+    args = parser.parse_args()
+
+    global MAX_PROFILES_PER_RUN, FRESH_TTL
+    if args.limit is not None:
+        MAX_PROFILES_PER_RUN = args.limit
+    if args.ttl is not None:
+        FRESH_TTL = args.ttl
+
+    print("\n" + "="*80)
+    print("🚀 DamaDam Master Bot v1.0.202 - Starting")
+    print("="*80 + "\n")
+
+    if not args.profile:
+        run_bot()
+        return
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(run_bot)
+    finally:
+        # Main thread only: page fetches in the worker threads show up as waits on their results
+        profiler.dump_stats(PROFILE_STATS_FILE)
+        log_msg(f"📊 Profile saved to {PROFILE_STATS_FILE}")
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+
+def run_bot():
+    """Set up the browser and sheets once, then run (and auto-repeat) the scraper"""
+    # Check run mode
+    run_mode = os.getenv('RUN_MODE', 'online').lower()
+    log_msg(f"📋 Run Mode: {run_mode.upper()}")
+    
+    # Initialize (browser, login and sheets are reused across auto-repeat runs)
+    log_msg("⚙️ Initializing...")
+    driver, session = start_browser_session()
+    if not driver:
+        return
+    
+    try:
+        client = gsheets_client()
+        sheets = Sheets(client)
+    except Exception as e:
+        log_msg(f"❌ Google Sheets error: {e}")
+        driver.quit()
+        return
+    
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+    
+    repeats = 0
+    try:
+        while not _stop_event.is_set():
+            run_started = time.monotonic()
+            if session:
+                run_once(driver, session, sheets, run_mode)
+            else:
+                log_msg("⚠️ Browser not logged in, skipping this run; login is retried while waiting for the next one")
+            repeats += 1
+            if not AUTO_REPEAT:
+                break
+            if MAX_REPEATS > 0 and repeats >= MAX_REPEATS:
+                log_msg(f"✅ Reached maximum repeats ({MAX_REPEATS})")
+                break
+            # Runs start every REPEAT_INTERVAL minutes, however long the scrape itself took
+            wait = max(0.0, REPEAT_INTERVAL * 60 - (time.monotonic() - run_started))
+            log_msg(f"⏳ Waiting {wait / 60:.1f} minutes before next run...")
+            driver, session = idle_between_runs(driver, session, wait)
+            if _stop_event.is_set():
+                break
+            if not session:
+                # One more attempt right before the run
+                driver, session = refresh_browser_session(driver, session)
+            if run_mode == 'sheet':
+                # Pick up nicknames queued in RunList since the last run
+                sheets.reload_runlist()
+    finally:
+        if driver:
+            quit_browser(driver)
 
 if __name__ == "__main__":
     main()